@@ -2,12 +2,12 @@ from flask import Flask, request, jsonify
 from flask_cors import CORS
 from werkzeug.utils import secure_filename
 import os
-import re
 import uuid
 from deep_translator import GoogleTranslator
 
 # 导入业务逻辑
 from get_best_image import get_valid_image_for_dish
+from menu_utils import filter_dish_names, allowed_file, IMAGE_SOURCE_FOLDER
 
 print("[app.py] Loading OCR service...")
 from ocr import paddle_service
@@ -16,59 +16,6 @@ print("[app.py] OCR service loaded.")
 app = Flask(__name__)
 
 
-# --- 辅助函数：校验是否为有效菜名 ---
-def is_valid_dish_name(text):
-    if not text or len(text.strip()) < 3:
-        return False
-    
-    text = text.strip()
-    
-    # 排除纯数字或符号
-    if re.match(r'^[\d\s\-\.]+$', text):
-        return False
-    
-    # 排除电话号码格式
-    if re.match(r'^\(?\d{3}\)?[\s\-]?\d{3}[\s\-]?\d{4}$', text):
-        return False
-    
-    # 排除地址关键词
-    address_keywords = ['st.', 'street', 'ave', 'avenue', 'rd', 'road', 
-                       'blvd', 'boulevard', 'dr', 'drive', 'city', 'zip']
-    text_lower = text.lower()
-    if any(keyword in text_lower for keyword in address_keywords):
-        return False
-    
-    # 排除数字占比过高的文本
-    digit_count = sum(c.isdigit() for c in text)
-    if digit_count > len(text) * 0.5:
-        return False
-    
-    # 排除通用无意义词汇
-    ignore_list = [
-        'menu', 'hours', 'open', 'closed', 'phone', 'address',
-        'monday', 'tuesday', 'wednesday', 'thursday', 'friday', 
-        'saturday', 'sunday', 'website', 'email', 'contact'
-    ]
-    if text_lower in ignore_list:
-        return False
-    
-    # 必须包含字母
-    if not re.search(r'[a-zA-Z]{2,}', text):
-        return False
-    
-    return True
-
-# --- 辅助函数：过滤列表 ---
-def filter_dish_names(menu_items):
-    filtered = []
-    for item in menu_items:
-        dish_name = item.get('dish', '')
-        if is_valid_dish_name(dish_name):
-            filtered.append(item)
-        else:
-            print(f"[Filter] Filtered out non-dish: {dish_name}")
-    return filtered
-
 # --- 核心函数：批量翻译菜名 ---
 def get_batch_translations(dish_names):
     if not dish_names:
@@ -98,8 +45,6 @@ def get_batch_translations(dish_names):
         return {name: {"en": name, "zh": name, "es": name} for name in dish_names}
 
 # --- 配置 ---
-script_dir = os.path.dirname(os.path.abspath(__file__))
-IMAGE_SOURCE_FOLDER = os.path.join(script_dir, './images')
 app.config['IMAGE_SOURCE_FOLDER'] = IMAGE_SOURCE_FOLDER
 
 CORS(app, resources={
@@ -110,11 +55,6 @@ CORS(app, resources={
    }
 })
 
-ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'webp'}
-
-def allowed_file(filename):
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
-
 # --- 路由：上传并处理图片 ---
 @app.route('/api/upload-and-process', methods=['POST'])
 def upload_and_process():
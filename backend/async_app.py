@@ -0,0 +1,282 @@
+"""
+ASGI 版本的后端入口，路由与返回格式与 app.py 完全一致。
+
+- 出站 HTTP（搜图、校验图片、翻译）全部走共享的 httpx.AsyncClient
+- PaddleOCR 推理是 CPU 密集型，放到线程池里执行，不阻塞事件循环
+
+运行:
+    python async_app.py
+    # 或者
+    hypercorn async_app:app --bind 0.0.0.0:5001
+"""
+from quart import Quart, request, jsonify
+from quart_cors import cors
+from werkzeug.exceptions import UnsupportedMediaType
+from werkzeug.utils import secure_filename
+from concurrent.futures import ThreadPoolExecutor
+from bs4 import BeautifulSoup
+from requests.utils import default_user_agent
+import asyncio
+import os
+import uuid
+import httpx
+
+# 与 app.py 共用的校验/过滤逻辑
+from menu_utils import filter_dish_names, allowed_file, IMAGE_SOURCE_FOLDER
+from get_best_image import get_valid_image_for_dish_async, async_timeout
+
+print("[async_app.py] Loading OCR service...")
+from ocr import paddle_service
+print("[async_app.py] OCR service loaded.")
+
+app = Quart(__name__)
+app.config['IMAGE_SOURCE_FOLDER'] = IMAGE_SOURCE_FOLDER
+# Quart 默认限制请求体 16 MiB、读取超时 60 秒；Flask 两者都没有，保持一致
+app.config['MAX_CONTENT_LENGTH'] = None
+app.config['BODY_TIMEOUT'] = None
+
+app = cors(
+    app,
+    allow_origin="*",
+    allow_methods=["GET", "POST", "OPTIONS"],
+    allow_headers=["Content-Type"],
+)
+
+# --- 配置 ---
+TRANSLATE_URL = "https://translate.google.com/m"
+TRANSLATE_MAX_CHARS = 5000
+TRANSLATE_HEADERS = {"User-Agent": default_user_agent()}
+MAX_OUTBOUND_CONNECTIONS = int(os.environ.get("MAX_OUTBOUND_CONNECTIONS", 200))
+# 翻译走的是非官方抓取接口，限制全进程的并发请求数以免触发 429
+MAX_CONCURRENT_TRANSLATIONS = int(os.environ.get("MAX_CONCURRENT_TRANSLATIONS", 8))
+
+# PaddleOCR 引擎是单例且非线程安全，单线程串行推理
+ocr_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="paddle-ocr")
+translate_semaphore = asyncio.Semaphore(MAX_CONCURRENT_TRANSLATIONS)
+http_client = None
+
+
+@app.before_serving
+async def startup():
+    global http_client
+    http_client = httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=MAX_OUTBOUND_CONNECTIONS,
+            max_keepalive_connections=MAX_OUTBOUND_CONNECTIONS // 4,
+        ),
+    )
+
+
+@app.after_serving
+async def shutdown():
+    await http_client.aclose()
+    ocr_executor.shutdown(wait=False)
+
+
+# --- 辅助函数：在线程池中运行 OCR ---
+async def run_ocr(filepath):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(ocr_executor, paddle_service.predict_text_only, filepath)
+
+
+# --- 辅助函数：单条翻译（与 deep_translator.GoogleTranslator 请求同一接口）---
+async def translate_text(text, target, source='auto'):
+    """
+    按 deep_translator.GoogleTranslator.translate 的流程翻译单条文本:
+    - 输入须为 str 且少于 5000 字符；去除首尾空白，空串原样返回
+    - 429 单独报错，其它非 2xx 状态码报错
+    - 先找 div.t0，再找 div.result-container
+    - 结果与原文相同时返回去空白后的原文（deep_translator 只在带 hl 参数时
+      才会去掉 hl 重试，GoogleTranslator 默认不带 hl，因此这里也不重试）
+    使用 requests 的默认 User-Agent，与 deep_translator 发出的请求一致。
+    与 deep_translator 的差异: 不支持代理，请求有 15 秒超时，
+    异常类型为 ValueError / RuntimeError 而非 deep_translator 自定义异常。
+    """
+    if not isinstance(text, str) or len(text) >= TRANSLATE_MAX_CHARS:
+        raise ValueError(f"Invalid translation payload: {text!r}")
+    text = text.strip()
+    if not text or source == target:
+        return text
+
+    async with translate_semaphore:
+        response = await http_client.get(
+            TRANSLATE_URL,
+            params={"tl": target, "sl": source, "q": text},
+            headers=TRANSLATE_HEADERS,
+            timeout=async_timeout(15),
+        )
+    if response.status_code == 429:
+        raise RuntimeError("Translate server returned 429: too many requests")
+    if not 200 <= response.status_code < 300:
+        raise RuntimeError(f"Translate request failed with status {response.status_code}")
+
+    soup = BeautifulSoup(response.text, "html.parser")
+    element = soup.find("div", {"class": "t0"}) or soup.find("div", {"class": "result-container"})
+    if not element:
+        raise ValueError(f"No translation found for: {text}")
+    return element.get_text(strip=True)
+
+
+# --- 核心函数：批量翻译菜名（并发，逐条回退）---
+async def get_batch_translations(dish_names):
+    if not dish_names:
+        return {}
+
+    print(f"[Translate] Processing {len(dish_names)} items...")
+
+    zh_texts, es_texts = await asyncio.gather(
+        asyncio.gather(*(translate_text(name, 'zh-CN') for name in dish_names), return_exceptions=True),
+        asyncio.gather(*(translate_text(name, 'es') for name in dish_names), return_exceptions=True),
+    )
+
+    translations_map = {}
+    for name, zh_text, es_text in zip(dish_names, zh_texts, es_texts):
+        for result in (zh_text, es_text):
+            if isinstance(result, Exception):
+                print(f"[Translate Error] {name}: {result}")
+        translations_map[name] = {
+            "en": name,
+            "zh": name if isinstance(zh_text, Exception) else zh_text,
+            "es": name if isinstance(es_text, Exception) else es_text,
+        }
+    return translations_map
+
+
+# --- 辅助函数：翻译与搜图并发执行 ---
+async def enrich_dishes(filtered_items):
+    dish_names = [item.get('dish', '') for item in filtered_items]
+    searchable = [name for name in dish_names if name]
+
+    translations_map, images = await asyncio.gather(
+        get_batch_translations(dish_names),
+        asyncio.gather(*(
+            get_valid_image_for_dish_async(http_client, name, verbose=False)
+            for name in searchable
+        ), return_exceptions=True),
+    )
+
+    # 单个菜品搜图失败只影响该菜品
+    images_map = {}
+    for name, image in zip(searchable, images):
+        if isinstance(image, Exception):
+            print(f"[Image Error] {name}: {image}")
+            image = None
+        images_map[name] = image
+    return translations_map, images_map
+
+
+# --- 路由：上传并处理图片 ---
+@app.route('/api/upload-and-process', methods=['POST'])
+async def upload_and_process():
+    try:
+        files = await request.files
+        if 'image' not in files:
+            return jsonify({'success': False, 'error': 'No image file provided'}), 400
+
+        file = files['image']
+        if file.filename == '':
+            return jsonify({'success': False, 'error': 'No file selected'}), 400
+
+        if not allowed_file(file.filename):
+            return jsonify({'success': False, 'error': 'Invalid file type'}), 400
+
+        # 保存文件
+        original_filename = secure_filename(file.filename)
+        ext = original_filename.rsplit('.', 1)[1].lower() if '.' in original_filename else 'png'
+        unique_filename = f"{uuid.uuid4().hex}.{ext}"
+        filepath = os.path.join(app.config['IMAGE_SOURCE_FOLDER'], unique_filename)
+        os.makedirs(app.config['IMAGE_SOURCE_FOLDER'], exist_ok=True)
+        await file.save(filepath)
+
+        print(f"[Upload] File saved, starting OCR...")
+
+        # OCR 识别
+        ocr_result = await run_ocr(filepath)
+        if not ocr_result.get('success'):
+            return jsonify({'success': False, 'error': 'OCR recognition failed'}), 500
+
+        menu_items = ocr_result.get('menu_items', [])
+        filtered_items = filter_dish_names(menu_items)
+
+        # 翻译 + 搜图
+        translations_map, images = await enrich_dishes(filtered_items)
+
+        # 组装结果
+        results = []
+        for item in filtered_items:
+            dish_name = item.get('dish', '')
+            if dish_name:
+                results.append({
+                    'dish': dish_name,
+                    'translations': translations_map.get(dish_name),
+                    'price': item.get('price', ''),
+                    'image': images.get(dish_name)
+                })
+
+        return jsonify({
+            'success': True,
+            'ocr_time': ocr_result.get('inference_time_seconds', 0),
+            'dishes_found': len(results),
+            'menu_with_images': results
+        })
+
+    except Exception as e:
+        print(f"Error in upload_and_process: {str(e)}")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+# --- 路由：OCR + 搜图 (Demo 模式) ---
+@app.route('/api/menu/ocr-with-images', methods=['POST'])
+async def ocr_with_images():
+    try:
+        # Quart 对非 JSON 请求返回 None，Flask 则抛出 415，这里保持 Flask 的行为
+        if not request.is_json:
+            raise UnsupportedMediaType(
+                "Did not attempt to load JSON data because the request"
+                " Content-Type was not 'application/json'."
+            )
+        data = await request.get_json()
+        filename = data.get('filename')
+        if not filename:
+            return jsonify({'success': False, 'error': 'Missing filename'}), 400
+
+        base_dir = app.config['IMAGE_SOURCE_FOLDER']
+        target_path = os.path.join(base_dir, filename)
+        if not os.path.exists(target_path):
+            return jsonify({'success': False, 'error': 'File not found'}), 404
+
+        ocr_result = await run_ocr(target_path)
+        if not ocr_result.get('success'):
+            return jsonify({'success': False, 'error': 'OCR failed'}), 500
+
+        filtered_items = filter_dish_names(ocr_result.get('menu_items', []))
+
+        # 翻译 + 搜图
+        translations_map, images = await enrich_dishes(filtered_items)
+
+        results = []
+        for item in filtered_items:
+            dish_name = item.get('dish', '')
+            if dish_name:
+                results.append({
+                    'dish': dish_name,
+                    'translations': translations_map.get(dish_name),
+                    'image': images.get(dish_name)
+                })
+
+        return jsonify({
+            'success': True,
+            'ocr_time': ocr_result.get('inference_time_seconds', 0),
+            'dishes_found': len(results),
+            'menu_with_images': results
+        })
+
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+# 健康检查
+@app.route('/api/health', methods=['GET'])
+async def health_check():
+    return jsonify({'status': 'ok', 'service': 'dish-image-api'})
+
+if __name__ == '__main__':
+    app.run(host='0.0.0.0', port=5001, debug=True)
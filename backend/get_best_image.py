@@ -1,6 +1,7 @@
 import os
 import json
 import time
+import httpx
 import requests
 import webbrowser
 from typing import List, Dict, Optional
@@ -14,10 +15,27 @@ GOOGLE_CX  = "233a894886fd54a8a"
 CANDIDATES_PER_DISH = 8
 ALLOWED_MIME_PREFIX = ("image/",)
 
+SEARCH_URL = "https://www.googleapis.com/customsearch/v1"
+PROBLEMATIC_DOMAINS = ['instagram.com', 'facebook.com', 'twitter.com']
+VERIFY_HEADERS = {
+   'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+
 
 # ============ core functions ============
 
 
+def _search_params(query, count):
+   return {
+       "key": GOOGLE_KEY,
+       "cx": GOOGLE_CX,
+       "q": query,
+       "searchType": "image",
+       "num": min(10, count),
+       "safe": "high",
+   }
+
+
 def search_google_images(query, count = 10):
    """
    search google images
@@ -30,16 +48,7 @@ def search_google_images(query, count = 10):
        return []
 
 
-   url = "https://www.googleapis.com/customsearch/v1"
-   params = {
-       "key": GOOGLE_KEY,
-       "cx": GOOGLE_CX,
-       "q": query,
-       "searchType": "image",
-       "num": min(10, count),
-       "safe": "high",
-   }
-   r = requests.get(url, params=params, timeout=15)
+   r = requests.get(SEARCH_URL, params=_search_params(query, count), timeout=15)
    try:
        r.raise_for_status()
    except Exception as e:
@@ -108,14 +117,10 @@ def best_image_for_dish(dish_name):
 
 def verify_image_url(url, timeout=5):
    try:
-       problematic_domains = ['instagram.com', 'facebook.com', 'twitter.com']
-       if any(domain in url.lower() for domain in problematic_domains):
+       if any(domain in url.lower() for domain in PROBLEMATIC_DOMAINS):
            return False
        
-       headers = {
-           'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-       }
-       response = requests.head(url, timeout=timeout, allow_redirects=True, headers=headers)
+       response = requests.head(url, timeout=timeout, allow_redirects=True, headers=VERIFY_HEADERS)
        
        if response.status_code != 200:
            return False
@@ -158,6 +163,117 @@ def get_valid_image_for_dish(dish_name, verbose=True):
    if verbose:
        print("all candidate images are not accessible")
    return None
+
+
+# ============ async variants (httpx.AsyncClient) ============
+
+
+def async_timeout(seconds):
+   """
+   httpx timeout for the shared client
+   a plain float would also bound the wait for a free pooled connection,
+   which under load fails requests before they are ever sent; the pool
+   size (httpx.Limits) is what bounds concurrency, so waiting there is unlimited
+   """
+   return httpx.Timeout(seconds, pool=None)
+
+
+async def search_google_images_async(client, query, count = 10):
+   """
+   search google images without blocking the event loop
+   client: shared httpx.AsyncClient
+   query: search query
+   count: number of images to return
+   return: list of images
+   """
+   if not (GOOGLE_KEY and GOOGLE_CX):
+       print("missing GOOGLE_KEY or GOOGLE_CX")
+       return []
+
+
+   try:
+       r = await client.get(SEARCH_URL, params=_search_params(query, count), timeout=async_timeout(15))
+   except Exception as e:
+       print("request failed: ", repr(e))
+       return []
+   try:
+       r.raise_for_status()
+   except Exception as e:
+       print("request failed: ", e, "\nresponse content: ", r.text)
+       return []
+   try:
+       data = r.json()
+   except ValueError as e:
+       print("invalid search response: ", e, "\nresponse content: ", r.text)
+       return []
+   return data.get("items", [])
+
+
+async def best_image_for_dish_async(client, dish_name):
+   """
+   get the best image for a dish
+   client: shared httpx.AsyncClient
+   dish_name: dish name
+   return: list of images
+   """
+   query = f"{dish_name} food"
+   items_g = await search_google_images_async(client, query, count=CANDIDATES_PER_DISH)
+   return pick_best_image_from_google(items_g, top_n=5)
+
+
+async def verify_image_url_async(client, url, timeout=5):
+   try:
+       if any(domain in url.lower() for domain in PROBLEMATIC_DOMAINS):
+           return False
+       
+       response = await client.head(url, timeout=async_timeout(timeout), follow_redirects=True, headers=VERIFY_HEADERS)
+       
+       if response.status_code != 200:
+           return False
+       
+       content_type = response.headers.get('Content-Type', '').lower()
+       if content_type and not content_type.startswith('image/'):
+           return False
+       
+       return True
+   except Exception:
+       return False
+
+
+async def get_valid_image_for_dish_async(client, dish_name, verbose=True):
+   """
+   get the valid image for a dish
+   client: shared httpx.AsyncClient
+   dish_name: dish name
+   verbose: whether to print verbose output
+   return: valid image
+   """
+   candidate_images = await best_image_for_dish_async(client, dish_name)
+  
+   if not candidate_images:
+       if verbose:
+           print("no candidate images found")
+       return None
+  
+   # candidates are checked one at a time like the sync version;
+   # concurrency comes from running many dishes at once
+   for i, img in enumerate(candidate_images, 1):
+       if verbose:
+           print(f"try candidate {i}/{len(candidate_images)}: {img['width']}x{img['height']}")
+      
+       if await verify_image_url_async(client, img["url"]):
+           if verbose:
+               print(f"find accessible image")
+           return img
+       else:
+           if verbose:
+               print(f"image is not accessible")
+  
+   if verbose:
+       print("all candidate images are not accessible")
+   return None
+
+
 def main():
    sample_input = [
        {"dish": "Drunken Raw Crab"},
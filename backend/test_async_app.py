@@ -0,0 +1,298 @@
+import asyncio
+import importlib
+import io
+import os
+import sys
+import types
+
+import pytest
+
+pytest.importorskip("quart")
+pytest.importorskip("quart_cors")
+pytest.importorskip("bs4")
+httpx = pytest.importorskip("httpx")
+
+from get_best_image import get_valid_image_for_dish_async
+
+# PaddleOCR 模型加载很重，测试里用固定结果替代 OCR 单例
+OCR_RESULT = {
+    "success": True,
+    "inference_time_seconds": 0.5,
+    "menu_items": [{"dish": "Kung Pao Chicken"}, {"dish": "Mapo Tofu"}, {"dish": "menu"}],
+}
+
+# 大于 Quart 默认的 16 MiB 请求体上限
+LARGE_UPLOAD = b"\x89PNG" + b"\x00" * (17 * 1024 * 1024)
+
+
+class FakeOCRService:
+    def __init__(self):
+        self.paths = []
+
+    def predict_text_only(self, input_path):
+        self.paths.append(input_path)
+        return OCR_RESULT
+
+
+@pytest.fixture(scope="module")
+def ocr_service():
+    return FakeOCRService()
+
+
+@pytest.fixture(scope="module")
+def async_app(ocr_service):
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setitem(sys.modules, "ocr", types.SimpleNamespace(paddle_service=ocr_service))
+        yield importlib.import_module("async_app")
+    # 这两个模块在导入时绑定了假的 OCR，不留给后续测试
+    sys.modules.pop("async_app", None)
+    sys.modules.pop("app", None)
+
+
+@pytest.fixture(scope="module")
+def flask_app(async_app):
+    pytest.importorskip("flask_cors")
+    pytest.importorskip("deep_translator")
+    return importlib.import_module("app")
+
+
+@pytest.fixture
+def image_folder(tmp_path, monkeypatch, async_app):
+    monkeypatch.setitem(async_app.app.config, "IMAGE_SOURCE_FOLDER", str(tmp_path))
+    return tmp_path
+
+
+IMAGE_ITEMS = [
+    {"link": "https://img.test/small.jpg", "title": "small",
+     "image": {"width": 100, "height": 100, "mime": "image/jpeg", "contextLink": "https://img.test/s"}},
+    {"link": "https://img.test/large.jpg", "title": "large",
+     "image": {"width": 1000, "height": 1000, "mime": "image/jpeg", "contextLink": "https://img.test/l"}},
+    {"link": "https://img.test/medium.jpg", "title": "medium",
+     "image": {"width": 500, "height": 500, "mime": "image/jpeg", "contextLink": "https://img.test/m"}},
+]
+
+EXPECTED_IMAGE = {
+    "url": "https://img.test/medium.jpg",
+    "width": 500,
+    "height": 500,
+    "title": "medium",
+    "contextLink": "https://img.test/m",
+    "thumbnailLink": "",
+}
+
+
+def make_transport(dead_urls=("https://img.test/large.jpg",), search=None, translate=None, head_log=None):
+    def handler(request):
+        if request.url.host == "www.googleapis.com":
+            if search:
+                return search(request)
+            return httpx.Response(200, json={"items": IMAGE_ITEMS})
+        if request.url.host == "translate.google.com":
+            if translate:
+                return translate(request)
+            q, tl = request.url.params["q"], request.url.params["tl"]
+            return httpx.Response(200, text=f'<html><div class="result-container">{tl}:{q}</div></html>')
+        if request.method == "HEAD":
+            if head_log is not None:
+                head_log.append(str(request.url))
+            if str(request.url) in dead_urls:
+                return httpx.Response(404)
+            return httpx.Response(200, headers={"Content-Type": "image/jpeg"})
+        raise AssertionError(f"unexpected request: {request.method} {request.url}")
+    return httpx.MockTransport(handler)
+
+
+def run_with_client(module, transport, coro_fn):
+    async def runner():
+        client = httpx.AsyncClient(transport=transport)
+        previous, module.http_client = module.http_client, client
+        try:
+            return await coro_fn(client)
+        finally:
+            module.http_client = previous
+            await client.aclose()
+    return asyncio.run(runner())
+
+
+def post_async(module, path, transport=None, **kwargs):
+    async def call(client):
+        response = await module.app.test_client().post(path, **kwargs)
+        return response.status_code, await response.get_json()
+    return run_with_client(module, transport or make_transport(), call)
+
+
+def patch_flask_enrichment(monkeypatch, flask_app):
+    # 与 make_transport() 默认返回的翻译/图片一致
+    monkeypatch.setattr(flask_app, "get_batch_translations", lambda names: {
+        name: {"en": name, "zh": f"zh-CN:{name}", "es": f"es:{name}"} for name in names
+    })
+    monkeypatch.setattr(flask_app, "get_valid_image_for_dish", lambda name, verbose=True: dict(EXPECTED_IMAGE))
+
+
+def test_first_accessible_image_in_ranking_order_wins(async_app):
+    head_log = []
+    image = run_with_client(
+        async_app,
+        make_transport(head_log=head_log),
+        lambda client: get_valid_image_for_dish_async(client, "Mapo Tofu", verbose=False),
+    )
+
+    assert image == EXPECTED_IMAGE
+    # 最大的图不可访问，第二大的可访问后不再校验剩余候选
+    assert head_log == ["https://img.test/large.jpg", "https://img.test/medium.jpg"]
+
+
+def search_unreachable(request):
+    raise httpx.ConnectError("boom", request=request)
+
+
+def search_not_json(request):
+    return httpx.Response(200, text="<html>not json</html>")
+
+
+@pytest.mark.parametrize("search", [search_unreachable, search_not_json])
+def test_search_failure_gives_no_image(async_app, search):
+    image = run_with_client(
+        async_app,
+        make_transport(search=search),
+        lambda client: get_valid_image_for_dish_async(client, "Mapo Tofu", verbose=False),
+    )
+
+    assert image is None
+
+
+@pytest.mark.parametrize("html", [
+    '<html><div class="t0">宫保鸡丁</div></html>',
+    '<html><div class="result-container"> 宫保鸡丁 </div></html>',
+])
+def test_translate_text_parses_result(async_app, html):
+    transport = make_transport(translate=lambda request: httpx.Response(200, text=html))
+    result = run_with_client(
+        async_app, transport, lambda client: async_app.translate_text("  Kung Pao Chicken ", "zh-CN")
+    )
+
+    assert result == "宫保鸡丁"
+
+
+def test_translate_text_errors(async_app):
+    missing = make_transport(translate=lambda request: httpx.Response(200, text="<html></html>"))
+    with pytest.raises(ValueError):
+        run_with_client(async_app, missing, lambda client: async_app.translate_text("Mapo Tofu", "es"))
+
+    limited = make_transport(translate=lambda request: httpx.Response(429))
+    with pytest.raises(RuntimeError, match="429"):
+        run_with_client(async_app, limited, lambda client: async_app.translate_text("Mapo Tofu", "es"))
+
+
+def test_batch_translations_fall_back_per_name(async_app):
+    def translate(request):
+        if request.url.params["q"] == "Mapo Tofu":
+            return httpx.Response(429)
+        return httpx.Response(200, text=f'<div class="t0">{request.url.params["tl"]}</div>')
+
+    translations = run_with_client(
+        async_app,
+        make_transport(translate=translate),
+        lambda client: async_app.get_batch_translations(["Kung Pao Chicken", "Mapo Tofu"]),
+    )
+
+    assert translations == {
+        "Kung Pao Chicken": {"en": "Kung Pao Chicken", "zh": "zh-CN", "es": "es"},
+        "Mapo Tofu": {"en": "Mapo Tofu", "zh": "Mapo Tofu", "es": "Mapo Tofu"},
+    }
+
+
+def test_ocr_with_images_response(async_app):
+    status, body = post_async(async_app, "/api/menu/ocr-with-images", json={"filename": "menu2.png"})
+
+    assert status == 200
+    assert body["success"] is True
+    assert body["ocr_time"] == 0.5
+    assert body["dishes_found"] == 2
+    assert sorted(body["menu_with_images"], key=lambda d: d["dish"]) == [
+        {
+            "dish": "Kung Pao Chicken",
+            "translations": {"en": "Kung Pao Chicken", "zh": "zh-CN:Kung Pao Chicken", "es": "es:Kung Pao Chicken"},
+            "image": EXPECTED_IMAGE,
+        },
+        {
+            "dish": "Mapo Tofu",
+            "translations": {"en": "Mapo Tofu", "zh": "zh-CN:Mapo Tofu", "es": "es:Mapo Tofu"},
+            "image": EXPECTED_IMAGE,
+        },
+    ]
+
+
+def test_ocr_with_images_bad_search_response_keeps_menu(async_app):
+    transport = make_transport(search=search_not_json)
+    status, body = post_async(
+        async_app, "/api/menu/ocr-with-images", transport=transport, json={"filename": "menu2.png"}
+    )
+
+    assert status == 200
+    assert body["dishes_found"] == 2
+    assert all(dish["image"] is None for dish in body["menu_with_images"])
+
+
+def test_ocr_with_images_rejects_non_json_like_flask(async_app):
+    status, body = post_async(
+        async_app, "/api/menu/ocr-with-images", data=b"filename=menu2.png", headers={"Content-Type": "text/plain"}
+    )
+
+    assert status == 500
+    assert body["error"].startswith("415 Unsupported Media Type")
+
+
+def test_upload_large_file(async_app, image_folder, ocr_service):
+    from quart.datastructures import FileStorage
+
+    upload = FileStorage(io.BytesIO(LARGE_UPLOAD), filename="menu.png", content_type="image/png")
+    status, body = post_async(async_app, "/api/upload-and-process", files={"image": upload})
+
+    assert status == 200
+    assert body["success"] is True
+    assert body["dishes_found"] == 2
+    saved = ocr_service.paths[-1]
+    assert os.path.dirname(saved) == str(image_folder)
+    assert os.path.getsize(saved) == len(LARGE_UPLOAD)
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"json": {"filename": "menu2.png"}},
+    {"json": {"filename": "missing.png"}},
+    {"json": {}},
+    {"data": "filename=menu2.png", "content_type": "text/plain"},
+])
+def test_ocr_with_images_matches_flask(async_app, flask_app, monkeypatch, kwargs):
+    patch_flask_enrichment(monkeypatch, flask_app)
+
+    flask_response = flask_app.app.test_client().post("/api/menu/ocr-with-images", **kwargs)
+    if "content_type" in kwargs:
+        kwargs = {"data": kwargs["data"].encode(), "headers": {"Content-Type": kwargs["content_type"]}}
+    status, body = post_async(async_app, "/api/menu/ocr-with-images", **kwargs)
+
+    assert status == flask_response.status_code
+    assert body == flask_response.get_json()
+
+
+@pytest.mark.parametrize("field, filename, content", [
+    ("image", "menu.png", LARGE_UPLOAD),
+    ("image", "menu.txt", b"not an image"),
+    ("other", "menu.png", b"\x89PNG"),
+])
+def test_upload_and_process_matches_flask(async_app, flask_app, image_folder, monkeypatch, field, filename, content):
+    from quart.datastructures import FileStorage
+
+    patch_flask_enrichment(monkeypatch, flask_app)
+    monkeypatch.setitem(flask_app.app.config, "IMAGE_SOURCE_FOLDER", str(image_folder))
+
+    flask_response = flask_app.app.test_client().post(
+        "/api/upload-and-process",
+        data={field: (io.BytesIO(content), filename)},
+        content_type="multipart/form-data",
+    )
+    upload = FileStorage(io.BytesIO(content), filename=filename, content_type="application/octet-stream")
+    status, body = post_async(async_app, "/api/upload-and-process", files={field: upload})
+
+    assert status == flask_response.status_code
+    assert body == flask_response.get_json()